@@ -5,11 +5,120 @@ GitHub Action: AI-powered Helm values generator
 
 import os
 import sys
+import atexit
 import json
-import yaml
-import requests
-import base64
-from typing import Dict, Any, Optional, List
+import math
+import re
+import hashlib
+import functools
+import tempfile
+import time
+from typing import Dict, Any, Optional, List, Tuple, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import requests
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Markdown code fences wrapping the AI JSON payload; a json-tagged fence wins
+_JSON_FENCE_RE = re.compile(r"```json\s*(.*?)(?:```|$)", re.DOTALL)
+_FENCE_RE = re.compile(r"```\s*(.*?)(?:```|$)", re.DOTALL)
+
+# Static parts of the AI prompt, wrapped around the analysis context
+_PROMPT_HEAD = """Analyze the operational problems and generate Helm values recommendations.
+
+"""
+
+_PROMPT_TAIL = """
+
+Based on the operational incidents, metrics, and current values, provide:
+1. Analysis of current problems
+2. Specific value recommendations to solve issues
+3. Justification for each change
+
+Respond in JSON format:
+{
+  "analysis": "Detailed analysis of problems found",
+  "recommendations": {
+    "resources.requests.cpu": "new_value",
+    "resources.requests.memory": "new_value",
+    "resources.limits.cpu": "new_value",
+    "resources.limits.memory": "new_value",
+    "autoscaling.minReplicas": new_number,
+    "autoscaling.maxReplicas": new_number,
+    "livenessProbe.config.initialDelaySeconds": new_number,
+    "readinessProbe.config.initialDelaySeconds": new_number
+  },
+  "justifications": {
+    "resources.limits.memory": "Reason for this change"
+  }
+}"""
+
+# Retry policy for rate-limited or failing AI provider responses
+_RETRY_STATUSES = frozenset([429, 500, 502, 503, 504])
+_MAX_ATTEMPTS = 4
+_MAX_RETRY_DELAY = 30
+
+_http_session: Optional['requests.Session'] = None
+
+def get_http_session() -> 'requests.Session':
+    """Return a shared HTTP session so AI calls reuse keep-alive connections
+    
+    requests is imported here rather than at module level so runs that fail
+    validation never pay its import cost.
+    """
+    global _http_session
+    if _http_session is None:
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+        
+        _http_session = requests.Session()
+        _http_session.mount('https://', HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=10,
+            # Connection failures only; 429/5xx are retried in call_chat_completion
+            max_retries=Retry(total=3, read=0, backoff_factor=0.5)
+        ))
+        atexit.register(_http_session.close)
+    return _http_session
+
+@functools.lru_cache(maxsize=None)
+def _yaml_module():
+    """Import PyYAML on first use, warning once if the libyaml C bindings are missing"""
+    import yaml
+    if not yaml.__with_libyaml__:
+        print("::warning::PyYAML is running without libyaml, YAML parsing will be slower")
+    return yaml
+
+def yaml_load(text: str) -> Any:
+    """Parse YAML with the libyaml-backed safe loader when available"""
+    yaml = _yaml_module()
+    return yaml.load(text, Loader=getattr(yaml, 'CSafeLoader', yaml.SafeLoader))
+
+def yaml_dump(data: Any, **kwargs) -> str:
+    """Emit YAML with the libyaml-backed safe dumper when available"""
+    yaml = _yaml_module()
+    return yaml.dump(data, Dumper=getattr(yaml, 'CSafeDumper', yaml.SafeDumper), **kwargs)
+
+@functools.lru_cache(maxsize=256)
+def _split_path(path: str) -> Tuple[str, ...]:
+    """Split a dotted values path into keys, cached since paths recur"""
+    return tuple(path.split('.'))
+
+def json_loads(data) -> Any:
+    """Parse JSON from str or bytes, using orjson when available"""
+    return orjson.loads(data) if orjson else json.loads(data)
+
+def json_dumps(obj: Any, indent: bool = False) -> str:
+    """Serialize to JSON, using orjson when available (non-JSON scalars become strings)"""
+    if orjson:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(obj, default=str, option=option).decode('utf-8')
+    return json.dumps(obj, default=str, indent=2 if indent else None, ensure_ascii=False)
 
 class GitHubActionAIGenerator:
     def __init__(self):
@@ -27,7 +136,7 @@ class GitHubActionAIGenerator:
             if not helm_templates_raw or helm_templates_raw.strip() == '':
                 self.helm_templates = []
             else:
-                self.helm_templates = json.loads(helm_templates_raw)
+                self.helm_templates = json_loads(helm_templates_raw)
         except json.JSONDecodeError as e:
             print(f"::error::Failed to parse helm_templates JSON: {e}")
             print(f"::debug::Raw helm_templates value: {helm_templates_raw[:200]}...")
@@ -37,6 +146,20 @@ class GitHubActionAIGenerator:
         self.ai_token = os.getenv('INPUT_AI_TOKEN')
         self.ai_model = os.getenv('INPUT_AI_MODEL')
         
+        self.output_format = os.getenv('INPUT_OUTPUT_FORMAT') or 'yaml'
+        if self.output_format not in ('yaml', 'json'):
+            self.error(f"Unsupported output_format: {self.output_format} (expected yaml or json)")
+        
+        # Opt-in cache of AI responses between runs (TTL in seconds, 0 disables it).
+        # Docker actions only see mounted paths, so default to the workspace.
+        self.cache_dir = os.getenv('INPUT_CACHE_DIR') or os.path.join(
+            os.getenv('GITHUB_WORKSPACE') or tempfile.gettempdir(), '.ai-cache'
+        )
+        try:
+            self.cache_ttl = int(os.getenv('INPUT_CACHE_TTL') or 0)
+        except ValueError:
+            self.error("Invalid cache_ttl, expected a number of seconds")
+        
         if not all([self.app_name, self.environment, self.current_values, self.operational_context]):
             self.error("Missing required inputs")
     
@@ -47,8 +170,12 @@ class GitHubActionAIGenerator:
             return ''
         
         try:
-            decoded_bytes = base64.b64decode(encoded_value)
-            return decoded_bytes.decode('utf-8')
+            try:
+                # SIMD-accelerated drop-in replacement for the base64 module
+                import pybase64 as base64
+            except ImportError:
+                import base64
+            return str(base64.b64decode(encoded_value), 'utf-8')
         except Exception as e:
             print(f"::error::Failed to decode base64 input {env_var}: {e}")
             return ''
@@ -58,21 +185,39 @@ class GitHubActionAIGenerator:
         print(f"::error::{message}")
         sys.exit(1)
     
-    def output(self, name: str, value: str):
-        """Set GitHub Action output"""
-        # Escape multiline output properly for GitHub Actions
+    def output(self, outputs: Dict[str, str]):
+        """Set GitHub Action outputs with a single write to $GITHUB_OUTPUT"""
+        # Heredoc-style delimiters keep multiline values intact
         delimiter = f"EOF_{os.urandom(8).hex()}"
-        escaped_value = value.replace('%', '%25').replace('\n', '%0A').replace('\r', '%0D')
-        print(f"::set-output name={name}::{escaped_value}")
+        content = "".join(
+            f"{name}<<{delimiter}\n{value}\n{delimiter}\n" for name, value in outputs.items()
+        )
+        
+        output_file = os.getenv('GITHUB_OUTPUT')
+        if not output_file:
+            print("::warning::GITHUB_OUTPUT is not set, printing outputs instead")
+            print(content)
+            return
+        
+        with open(output_file, 'a', encoding='utf-8') as f:
+            f.write(content)
     
     def run(self):
         """Main action execution"""
         print(f"🤖 Generating values for {self.app_name} in {self.environment}")
         
+        # Validate configuration before doing any parsing or prompt building
+        if self.ai_provider not in ('copilot', 'openai'):
+            self.error(f"Unsupported AI provider: {self.ai_provider}")
+        if not self.ai_token:
+            self.error("AI token is required - set the ai_token input")
+        if not isinstance(self.helm_templates, list):
+            self.error("Invalid helm_templates format, expected a JSON array")
+        
         try:
             # Parse inputs
-            current_values = yaml.safe_load(self.current_values)
-            operational_data = yaml.safe_load(self.operational_context)
+            current_values = self.parse_structured_input(self.current_values)
+            operational_data = self.parse_structured_input(self.operational_context)
             
             # Ensure operational_data is a dictionary
             if not isinstance(operational_data, dict):
@@ -84,42 +229,87 @@ class GitHubActionAIGenerator:
             print(f"🔍 Processing operational data with {len(operational_data.get('recent_incidents', []))} incidents")
             
             # Generate AI analysis context
-            context = self.build_analysis_context(current_values, operational_data)
+            context = self.build_analysis_context(self.current_values, self.operational_context)
             
             # Generate recommendations
-            recommendations = self.generate_ai_recommendations(context)
+            recommendations, cache_key = self.generate_ai_recommendations(context)
             
             if not recommendations:
                 self.error("Failed to generate AI recommendations - check AI provider configuration and token")
             
             # Apply recommendations to current values
-            updated_values = self.apply_recommendations(current_values, recommendations)
+            updated_values, changed_paths = self.apply_recommendations(current_values, recommendations)
+            
+            # Only cache fresh responses that could actually be applied
+            if cache_key:
+                self.save_cached_response(cache_key, recommendations)
             
             # Generate outputs
-            generated_yaml = yaml.dump(updated_values, default_flow_style=False, sort_keys=False)
-            changes = self.summarize_changes(current_values, updated_values)
+            generated_yaml = None
+            if self.output_format == 'json':
+                # JSON is valid YAML and much cheaper to emit
+                try:
+                    generated_yaml = self.dump_values_json(updated_values)
+                except ValueError as e:
+                    print(f"::warning::Cannot emit values as JSON ({e}), falling back to YAML")
+            if generated_yaml is None:
+                generated_yaml = yaml_dump(updated_values, default_flow_style=False, sort_keys=False)
+            changes = self.summarize_changes_by_paths(current_values, updated_values, changed_paths)
             
             # Set outputs
-            self.output('generated_values', generated_yaml)
-            self.output('ai_analysis', recommendations.get('analysis', 'Analysis completed'))
-            self.output('changes_summary', changes)
+            self.output({
+                'generated_values': generated_yaml,
+                'ai_analysis': recommendations.get('analysis', 'Analysis completed'),
+                'changes_summary': changes
+            })
             
             print("✅ Successfully generated optimized values.yaml")
             
         except Exception as e:
             self.error(f"Action failed: {str(e)}")
     
-    def build_analysis_context(self, current_values: Dict, operational_data: Dict) -> str:
-        """Build context for AI analysis"""
+    def dump_values_json(self, values: Dict[str, Any]) -> str:
+        """Emit values as indented JSON, raising ValueError for values JSON cannot represent"""
+        stack = [values]
+        seen = set()
+        while stack:
+            node = stack.pop()
+            if isinstance(node, float) and not math.isfinite(node):
+                raise ValueError(f"non-finite number {node}")
+            if isinstance(node, (dict, list)) and id(node) not in seen:
+                seen.add(id(node))
+                stack.extend(node.values() if isinstance(node, dict) else node)
+        
+        try:
+            return json_dumps(values, indent=True)
+        except TypeError as e:
+            # orjson.JSONEncodeError (e.g. integers wider than 64 bits)
+            raise ValueError(str(e)) from e
+    
+    def parse_structured_input(self, text: str) -> Any:
+        """Parse an input as JSON when it looks like a JSON document, otherwise as YAML
+        
+        JSON inputs follow JSON typing, which can differ from YAML 1.1
+        (e.g. 1e3 is a float in JSON but a string to PyYAML).
+        """
+        if text.lstrip()[:1] in ('{', '['):
+            try:
+                return json_loads(text)
+            except ValueError:
+                pass
+        return yaml_load(text)
+    
+    def build_analysis_context(self, current_values_text: str, operational_data_text: str) -> str:
+        """Build context for AI analysis from the raw (already decoded) inputs"""
         context_parts = [
             f"APPLICATION: {self.app_name}",
             f"ENVIRONMENT: {self.environment}",
             "",
             "CURRENT VALUES:",
-            yaml.dump(current_values, default_flow_style=False),
+            current_values_text,
             "",
             "OPERATIONAL CONTEXT:",
-            yaml.dump(operational_data, default_flow_style=False)
+            operational_data_text
         ]
         
         if self.helm_templates:
@@ -131,150 +321,156 @@ class GitHubActionAIGenerator:
         
         return "\n".join(context_parts)
     
-    def generate_ai_recommendations(self, context: str) -> Optional[Dict[str, Any]]:
-        """Generate AI recommendations"""
-        prompt = f"""Analyze the operational problems and generate Helm values recommendations.
-
-{context}
-
-Based on the operational incidents, metrics, and current values, provide:
-1. Analysis of current problems
-2. Specific value recommendations to solve issues
-3. Justification for each change
-
-Respond in JSON format:
-{{
-  "analysis": "Detailed analysis of problems found",
-  "recommendations": {{
-    "resources.requests.cpu": "new_value",
-    "resources.requests.memory": "new_value",
-    "resources.limits.cpu": "new_value",
-    "resources.limits.memory": "new_value",
-    "autoscaling.minReplicas": new_number,
-    "autoscaling.maxReplicas": new_number,
-    "livenessProbe.config.initialDelaySeconds": new_number,
-    "readinessProbe.config.initialDelaySeconds": new_number
-  }},
-  "justifications": {{
-    "resources.limits.memory": "Reason for this change"
-  }}
-}}"""
+    def generate_ai_recommendations(self, context: str) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+        """Generate AI recommendations
+        
+        Returns the recommendations and, for fresh (uncached) responses, the
+        cache key to store them under once they have been applied.
+        """
+        prompt = _PROMPT_HEAD + context + _PROMPT_TAIL
 
+        cache_key = hashlib.sha256(
+            f"{self.ai_provider}\0{self.ai_model or ''}\0{prompt}".encode('utf-8')
+        ).hexdigest()
+        cached = self.load_cached_response(cache_key)
+        if cached is not None:
+            print(f"♻️ Using cached AI recommendations ({cache_key[:12]})")
+            return cached, None
+        
         if self.ai_provider == 'copilot':
-            return self.call_github_models(prompt)
+            result = self.call_github_models(prompt)
         elif self.ai_provider == 'openai':
-            return self.call_openai(prompt)
+            result = self.call_openai(prompt)
         else:
             print(f"::warning::Unsupported AI provider: {self.ai_provider}")
-            return None
+            return None, None
+        
+        return result, cache_key
     
-    def call_github_models(self, prompt: str) -> Optional[Dict[str, Any]]:
-        """Call GitHub Models API"""
-        if not self.ai_token:
-            print("::error::AI token is required for GitHub Models API")
+    def load_cached_response(self, key: str) -> Optional[Dict[str, Any]]:
+        """Load cached AI recommendations if present and not expired"""
+        if self.cache_ttl <= 0:
             return None
         
+        path = os.path.join(self.cache_dir, f"{key}.json")
         try:
-            print("🤖 Calling GitHub Models API...")
-            response = requests.post(
-                'https://models.github.ai/inference/chat/completions',
-                headers={
-                    'Authorization': f'Bearer {self.ai_token}',
-                    'Content-Type': 'application/json'
-                },
-                json={
-                    'model': self.ai_model or 'gpt-4o',
-                    'messages': [
-                        {
-                            'role': 'system', 
-                            'content': 'You are a Kubernetes expert. Respond only with valid JSON.'
-                        },
-                        {
-                            'role': 'user', 
-                            'content': prompt
-                        }
-                    ],
-                    'max_tokens': 1500,
-                    'temperature': 0.1
-                },
-                timeout=60
-            )
-            
-            if response.status_code != 200:
-                print(f"::error::GitHub Models API returned {response.status_code}: {response.text}")
+            if time.time() - os.path.getmtime(path) > self.cache_ttl:
                 return None
-            
-            ai_response = response.json()['choices'][0]['message']['content']
-            print(f"🤖 AI Response received: {len(ai_response)} characters")
-            
-            # Clean and parse JSON response
-            return self.parse_ai_json_response(ai_response)
-            
-        except Exception as e:
-            print(f"::error::GitHub Models API error: {e}")
+            with open(path, 'r', encoding='utf-8') as f:
+                cached = json_loads(f.read())
+        except (OSError, ValueError):
+            return None
+        
+        if not isinstance(cached, dict) or not isinstance(cached.get('recommendations'), dict):
+            print(f"::warning::Ignoring malformed AI response cache entry {key[:12]}")
             return None
+        return cached
+    
+    def save_cached_response(self, key: str, result: Dict[str, Any]):
+        """Atomically write AI recommendations to the cache"""
+        if self.cache_ttl <= 0:
+            return
+        
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                    f.write(json_dumps(result))
+                os.replace(tmp_path, os.path.join(self.cache_dir, f"{key}.json"))
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except OSError as e:
+            print(f"::warning::Failed to write AI response cache: {e}")
+    
+    def call_github_models(self, prompt: str) -> Optional[Dict[str, Any]]:
+        """Call GitHub Models API"""
+        return self.call_chat_completion(
+            'GitHub Models API',
+            'https://models.github.ai/inference/chat/completions',
+            self.ai_model or 'gpt-4o',
+            prompt
+        )
     
     def call_openai(self, prompt: str) -> Optional[Dict[str, Any]]:
         """Call OpenAI API"""
-        if not self.ai_token:
-            print("::error::AI token is required for OpenAI API")
-            return None
-        
+        return self.call_chat_completion(
+            'OpenAI API',
+            'https://api.openai.com/v1/chat/completions',
+            self.ai_model or 'gpt-4',
+            prompt
+        )
+    
+    def call_chat_completion(self, api_name: str, url: str, model: str, prompt: str) -> Optional[Dict[str, Any]]:
+        """Call an OpenAI-compatible chat completions endpoint"""
         try:
-            print("🤖 Calling OpenAI API...")
-            response = requests.post(
-                'https://api.openai.com/v1/chat/completions',
-                headers={
-                    'Authorization': f'Bearer {self.ai_token}',
-                    'Content-Type': 'application/json'
-                },
-                json={
-                    'model': self.ai_model or 'gpt-4',
-                    'messages': [
-                        {
-                            'role': 'system',
-                            'content': 'You are a Kubernetes expert. Respond only with valid JSON.'
-                        },
-                        {
-                            'role': 'user',
-                            'content': prompt
-                        }
-                    ],
-                    'max_tokens': 1500,
-                    'temperature': 0.1
-                },
-                timeout=60
-            )
+            print(f"🤖 Calling {api_name}...")
+            for attempt in range(_MAX_ATTEMPTS):
+                response = get_http_session().post(
+                    url,
+                    headers={
+                        'Authorization': f'Bearer {self.ai_token}',
+                        'Content-Type': 'application/json'
+                    },
+                    json={
+                        'model': model,
+                        'messages': [
+                            {
+                                'role': 'system',
+                                'content': 'You are a Kubernetes expert. Respond only with valid JSON.'
+                            },
+                            {
+                                'role': 'user',
+                                'content': prompt
+                            }
+                        ],
+                        'max_tokens': 1500,
+                        'temperature': 0.1
+                    },
+                    timeout=60
+                )
+                
+                if response.status_code not in _RETRY_STATUSES or attempt == _MAX_ATTEMPTS - 1:
+                    break
+                
+                delay = self.retry_delay(response, attempt)
+                print(f"::warning::{api_name} returned {response.status_code}, retrying in {delay}s")
+                time.sleep(delay)
             
             if response.status_code != 200:
-                print(f"::error::OpenAI API returned {response.status_code}: {response.text}")
+                print(f"::error::{api_name} returned {response.status_code}: {response.text}")
                 return None
             
-            ai_response = response.json()['choices'][0]['message']['content']
+            ai_response = json_loads(response.content)['choices'][0]['message']['content']
             print(f"🤖 AI Response received: {len(ai_response)} characters")
             
             # Clean and parse JSON response
             return self.parse_ai_json_response(ai_response)
             
         except Exception as e:
-            print(f"::error::OpenAI API error: {e}")
+            print(f"::error::{api_name} error: {e}")
             return None
     
+    def retry_delay(self, response: 'requests.Response', attempt: int) -> float:
+        """Seconds to wait before retrying, honouring Retry-After on 429"""
+        if response.status_code == 429:
+            try:
+                return min(max(int(response.headers.get('Retry-After', '')), 0), _MAX_RETRY_DELAY)
+            except ValueError:
+                pass
+        return min(2 ** attempt, _MAX_RETRY_DELAY)
+    
     def parse_ai_json_response(self, ai_response: str) -> Optional[Dict[str, Any]]:
         """Parse AI response and extract JSON"""
         try:
             # Remove markdown code blocks if present
-            if '```json' in ai_response:
-                json_start = ai_response.find('```json') + 7
-                json_end = ai_response.find('```', json_start)
-                ai_response = ai_response[json_start:json_end].strip()
-            elif '```' in ai_response:
-                json_start = ai_response.find('```') + 3
-                json_end = ai_response.find('```', json_start)
-                ai_response = ai_response[json_start:json_end].strip()
+            match = _JSON_FENCE_RE.search(ai_response) or _FENCE_RE.search(ai_response)
+            if match:
+                ai_response = match.group(1).strip()
             
             # Parse JSON
-            result = json.loads(ai_response)
+            result = json_loads(ai_response)
             
             # Validate required fields
             if not isinstance(result, dict):
@@ -293,48 +489,75 @@ Respond in JSON format:
             print(f"::debug::AI response (first 500 chars): {ai_response[:500]}...")
             return None
     
-    def apply_recommendations(self, current_values: Dict[str, Any], recommendations: Dict[str, Any]) -> Dict[str, Any]:
-        """Apply AI recommendations to current values"""
+    def apply_recommendations(self, current_values: Dict[str, Any], recommendations: Dict[str, Any]) -> Tuple[Dict[str, Any], List[str]]:
+        """Apply AI recommendations to current values, returning the updated values and written paths"""
         updated_values = self.deep_copy_dict(current_values)
+        changed_paths = []
         
         for path, value in recommendations.get('recommendations', {}).items():
             print(f"📝 Applying: {path} = {value}")
             self.set_nested_value(updated_values, path, value)
+            changed_paths.append(path)
         
-        return updated_values
+        return updated_values, changed_paths
     
-    def deep_copy_dict(self, original: Dict) -> Dict:
-        """Deep copy a dictionary"""
-        import copy
-        return copy.deepcopy(original)
+    def deep_copy_dict(self, original: Dict, memo: Optional[Dict[int, Any]] = None) -> Dict:
+        """Deep copy a dictionary
+        
+        Only dicts and lists are copied; scalars from the safe loader are
+        immutable and returned as-is, which keeps their original types. The
+        id()-keyed memo preserves shared and self-referencing YAML aliases.
+        """
+        if not isinstance(original, (dict, list)):
+            return original
+        
+        if memo is None:
+            memo = {}
+        copied = memo.get(id(original))
+        if copied is not None:
+            return copied
+        
+        if isinstance(original, dict):
+            copied = memo[id(original)] = {}
+            for key, value in original.items():
+                copied[key] = self.deep_copy_dict(value, memo)
+        else:
+            copied = memo[id(original)] = []
+            for value in original:
+                copied.append(self.deep_copy_dict(value, memo))
+        return copied
     
     def set_nested_value(self, data: Dict[str, Any], path: str, value: Any):
         """Set nested dictionary value using dot notation"""
-        keys = path.split('.')
+        keys = _split_path(path)
         current = data
         
         for key in keys[:-1]:
-            if key not in current:
-                current[key] = {}
-            current = current[key]
+            current = current.setdefault(key, {})
         
         current[keys[-1]] = value
     
-    def summarize_changes(self, old_values: Dict[str, Any], new_values: Dict[str, Any]) -> str:
-        """Summarize changes made"""
+    def get_nested_value(self, data: Dict[str, Any], path: str) -> Any:
+        """Get nested dictionary value using dot notation, or None if missing"""
+        current = data
+        
+        for key in _split_path(path):
+            if not isinstance(current, dict):
+                return None
+            current = current.get(key)
+        
+        return current
+    
+    def summarize_changes_by_paths(self, old_values: Dict[str, Any], new_values: Dict[str, Any], paths: List[str]) -> str:
+        """Summarize changes made at the given recommendation paths"""
         changes = []
         
-        def compare_dicts(old_dict, new_dict, prefix=""):
-            for key, new_val in new_dict.items():
-                path = f"{prefix}.{key}" if prefix else key
-                old_val = old_dict.get(key)
-                
-                if isinstance(new_val, dict) and isinstance(old_val, dict):
-                    compare_dicts(old_val, new_val, path)
-                elif old_val != new_val:
-                    changes.append(f"• {path}: {old_val} → {new_val}")
+        for path in paths:
+            old_val = self.get_nested_value(old_values, path)
+            new_val = self.get_nested_value(new_values, path)
+            if old_val != new_val:
+                changes.append(f"• {path}: {old_val} → {new_val}")
         
-        compare_dicts(old_values, new_values)
         return "\n".join(changes) if changes else "No changes made"
 
 if __name__ == '__main__':